@@ -1,11 +1,25 @@
 from __future__ import annotations
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import httpx 
 from httpx import Timeout, URL, Headers, Response
 from httpx._types import ProxiesTypes
 
+DEFAULT_MAX_RETRIES = 2
+INITIAL_RETRY_DELAY = 0.5
+MAX_RETRY_DELAY = 8.0
+
+# Only retry failures the server cannot have acted on, so that non-idempotent
+# calls such as agents/trigger are never run twice.
+RETRY_STATUS_CODES = (429, 503)
+RETRY_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
 class SyncAPIClient:
     
     _client: httpx.Client
+    max_retries: int
 
     def __init__(
         self,
@@ -14,11 +28,53 @@ class SyncAPIClient:
         headers: Headers | None = None,
         timeout: float | Timeout | None = None,
         proxies: ProxiesTypes | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
     ) -> None:
         self._client = httpx.Client(base_url=base_url, headers=headers, timeout=timeout, proxies=proxies)
+        self.max_retries = max_retries
 
     def request(self, method: str, url: str, **kwargs) -> httpx.Response:
-        return self._client.request(method, url, **kwargs)
+        retries = 0
+        while True:
+            response = None
+            try:
+                response = self._client.request(method, url, **kwargs)
+            except RETRY_EXCEPTIONS:
+                if retries >= self.max_retries:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or retries >= self.max_retries:
+                    return response
+            delay = self._retry_delay(retries, response)
+            if delay is None:
+                return response
+            time.sleep(delay)
+            retries += 1
+
+    def _retry_delay(self, retries: int, response: Response | None) -> float | None:
+        # Returns None when the server asks us to wait longer than we are
+        # willing to block, in which case the response is handed back as is.
+        if response is not None:
+            header = response.headers.get("Retry-After")
+            retry_after = self._parse_retry_after(header) if header is not None else None
+            if retry_after is not None:
+                return retry_after if retry_after <= MAX_RETRY_DELAY else None
+        delay = min(INITIAL_RETRY_DELAY * 2 ** retries, MAX_RETRY_DELAY)
+        return delay + random.uniform(0, delay / 4)
+
+    def _parse_retry_after(self, header: str) -> float | None:
+        # Retry-After is either a number of seconds or an HTTP-date.
+        try:
+            return max(float(header), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(header)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
     
     def get(self, path: str, **kwargs) -> Response:
         return self.request("GET", path, **kwargs)
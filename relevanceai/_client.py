@@ -8,7 +8,7 @@ import httpx
 if TYPE_CHECKING:
     from . import resources
 
-from ._base_client import SyncAPIClient 
+from ._base_client import SyncAPIClient, DEFAULT_MAX_RETRIES
 
 class RelevanceAI(SyncAPIClient): 
     
@@ -28,6 +28,7 @@ class RelevanceAI(SyncAPIClient):
         region: str | None = None,
         project: str | None = None,
         base_url: str | httpx.URL | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
     ) -> None:
         
         if api_key is None: 
@@ -51,7 +52,7 @@ class RelevanceAI(SyncAPIClient):
         headers = {"Authorization": f"{self.project}:{self.api_key}"}
         base_url = f"https://api-{self.region}.stack.tryrelevance.com/latest"
 
-        super().__init__(base_url=base_url, headers=headers)
+        super().__init__(base_url=base_url, headers=headers, max_retries=max_retries)
         
         from . import resources
         self.agents = resources.Agents(self)
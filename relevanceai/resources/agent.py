@@ -32,7 +32,8 @@ class Agent(SyncAPIResource):
         response = self._post(path, body=body)
         tools = [Tool(**item) for item in response.json().get("results", [])]
         tools = [tool for tool in tools if tool.type != "agent"]
-        return sorted(tools, key=lambda x: x.title or "")
+        tools.sort(key=lambda x: x.title or "")
+        return tools
 
     def list_subagents(
         self,
@@ -42,7 +43,8 @@ class Agent(SyncAPIResource):
         response = self._post(path, body=body)
         tools = [Tool(**item) for item in response.json().get("results", [])]
         tools = [tool for tool in tools if tool.type == "agent"]
-        return sorted(tools, key=lambda x: x.title or "")
+        tools.sort(key=lambda x: x.title or "")
+        return tools
 
     def retrieve_task(self, conversation_id: str) -> Task:
         task_items = self.list_tasks(self.agent_id)
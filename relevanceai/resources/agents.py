@@ -4,23 +4,30 @@ from .._client import RelevanceAI
 from .._resource import SyncAPIResource
 
 from ..resources.agent import Agent
-from typing import List
+from typing import List, Optional
 
 
 class Agents(SyncAPIResource):
 
     _client: RelevanceAI
 
-    def list_agents(self) -> List[Agent]:
+    def list_agents(
+        self,
+        max_results: Optional[int] = None,
+    ) -> List[Agent]:
+        if max_results is not None and max_results < 1:
+            raise ValueError("max_results must be at least 1")
         path = "agents/list"
-        response = self._post(path)
+        body = {"sort": [{"update_date_": "desc"}]}
+        if max_results is not None:
+            body["page_size"] = max_results
+        response = self._post(path, body=body)
         agents = [
             Agent(client=self._client, **item)
             for item in response.json().get("results", [])
         ]
-        return sorted(
-            agents, key=lambda x: (x.metadata.name is None, x.metadata.name or "")
-        )
+        agents.sort(key=lambda x: (x.metadata.name is None, x.metadata.name or ""))
+        return agents
 
     def retrieve_agent(
         self,
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from .._resource import SyncAPIResource
 from .._client import RelevanceAI
-from typing import List
+from typing import List, Optional
 from ..types.knowledge import KnowledgeSet, KnowledgeRow
 
 class Knowledge(SyncAPIResource):
@@ -11,12 +11,17 @@ class Knowledge(SyncAPIResource):
 
     def list_knowledge(
         self, 
+        max_results: Optional[int] = None,
     ) -> List[KnowledgeSet]:
+        if max_results is not None and max_results < 1:
+            raise ValueError("max_results must be at least 1")
         path = "knowledge/sets/list"
         body = {
             "filters": [],
             "sort": [{"update_date":"desc"}]
         }
+        if max_results is not None:
+            body["page_size"] = max_results
         response = self._post(path, body=body)
         return [KnowledgeSet(**item) for item in response.json().get("results", [])]
     
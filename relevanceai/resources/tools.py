@@ -63,8 +63,13 @@ class Tools(SyncAPIResource):
         return json.dumps(steps, indent=4)
 
     def delete_tool(self, tool_id: str) -> bool:
+        return self.delete_tools([tool_id])
+
+    def delete_tools(self, tool_ids: List[str]) -> bool:
+        if not tool_ids:
+            return True
         path = "studios/bulk_delete"
-        body = {"ids": [tool_id]}
+        body = {"ids": tool_ids}
         response = self._post(path, body=body)
         return response.status_code == 200
 